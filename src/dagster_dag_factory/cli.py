@@ -1,13 +1,13 @@
 import click
+import functools
+import logging
 import os
 import sys
-import yaml
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from dagster_dag_factory.factory.dagster_factory import DagsterFactory
-from dagster_dag_factory.factory.registry import OperatorRegistry
-from dagster_dag_factory.factory.utils.logging import log_header, log_action
+# Heavy modules (Dagster, operators, resources, YAML) are imported inside the
+# commands that need them so that `dag-factory --help` stays fast.
 
 @click.group()
 def cli():
@@ -19,6 +19,9 @@ def cli():
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed build logs.")
 def lint(path, verbose):
     """Lint all YAML pipelines in a directory."""
+    from dagster_dag_factory.factory.dagster_factory import DagsterFactory
+    from dagster_dag_factory.factory.helpers.yaml_loader import iter_yaml_files, preload_yaml_cache
+
     base_path = Path(path)
     # If the path points to definitions.py or similar, move up to find the root
     if base_path.suffix == ".py":
@@ -29,10 +32,21 @@ def lint(path, verbose):
         base_path = base_path.parent
 
     click.echo(f"Linting pipelines in: {base_path}")
-    
+
     try:
         # Initialize factory in verbose mode if requested
         factory = DagsterFactory(base_dir=base_path, verbose_build=verbose or True)
+
+        # Parse every pipeline YAML up front across CPU cores; the factory build
+        # below then hits the warm YAML cache and stays single-process. Any
+        # failure here just leaves the build to parse files sequentially.
+        try:
+            preload_yaml_cache(iter_yaml_files(factory.defs_dir))
+        except Exception as e:
+            logging.getLogger("dagster_dag_factory").warning(
+                "Parallel YAML preload failed, parsing sequentially: %s", e, exc_info=verbose
+            )
+
         factory.build_definitions()
         click.secho("\n✅ All pipelines linted successfully!", fg="green", bold=True)
     except Exception as e:
@@ -42,22 +56,23 @@ def lint(path, verbose):
 @cli.command()
 def list_operators():
     """List all registered operators."""
+    OperatorRegistry = _load_operator_registry()
     click.echo("Registered Operators:")
     click.echo("-" * 60)
-    for (source, target), op_class in OperatorRegistry._registry.items():
-        click.echo(f"{source.ljust(15)} -> {target.ljust(15)} | {op_class.__name__}")
+    click.echo(OperatorRegistry.formatted_rows())
 
 @cli.command()
 @click.option("--file", "-f", required=True, type=click.Path(exists=True), help="Path to the YAML pipeline file.")
 def inspect(file):
     """Inspect how a YAML translates into Dagster Assets (Dry-Run)."""
+    from dagster_dag_factory.factory.helpers.yaml_loader import dump_yaml, load_yaml_cached
+
     yaml_path = Path(file)
     click.echo(f"Inspecting pipeline: {yaml_path.name}")
     click.echo("-" * 60)
 
     try:
-        with open(yaml_path) as f:
-            config = yaml.safe_load(f) or {}
+        config = load_yaml_cached(yaml_path) or {}
 
         if "assets" not in config:
             click.secho("No 'assets' found in YAML.", fg="yellow")
@@ -77,10 +92,10 @@ def inspect(file):
             
             # Show raw configs (as seen by the factory at build-time)
             click.secho("\n[Raw Source Payload]", fg="cyan")
-            click.echo(yaml.dump(source.get("configs", {}), default_flow_style=False))
+            click.echo(dump_yaml(source.get("configs", {})))
             
             click.secho("[Raw Target Payload]", fg="cyan")
-            click.echo(yaml.dump(target.get("configs", {}), default_flow_style=False))
+            click.echo(dump_yaml(target.get("configs", {})))
             
     except Exception as e:
         click.secho(f"Error inspecting file: {e}", fg="red")
@@ -92,6 +107,7 @@ def describe(args):
     """Describe the configuration schema for an operator (2 args: SOURCE TARGET) or a resource (1 arg: TYPE)."""
     if len(args) == 2:
         source_type, target_type = args
+        OperatorRegistry = _load_operator_registry()
         op_class = OperatorRegistry.get_operator(source_type, target_type)
         if not op_class:
             click.secho(f"No operator found for {source_type} -> {target_type}", fg="yellow")
@@ -140,20 +156,29 @@ def describe(args):
     else:
         click.secho("Usage: dag-factory describe <TYPE>  -or-  dag-factory describe <SOURCE> <TARGET>", fg="red")
 
-def _print_schema(model):
-    """Helper to print Pydantic model fields in a human-readable way."""
-    from pydantic import ConfigDict
-    
+def _load_operator_registry():
+    """Returns the operator registry; operators are imported lazily on lookup."""
+    from dagster_dag_factory.factory.registry import OperatorRegistry
+
+    return OperatorRegistry
+
+@functools.lru_cache(maxsize=None)
+def _get_schema(model) -> Tuple[Dict[str, Any], frozenset]:
+    """Returns the (properties, required) pair of a model's JSON schema, computed once per class."""
     # Use model_json_schema() for Pydantic V2
     schema = model.model_json_schema()
-    properties = schema.get("properties", {})
-    required = schema.get("required", [])
-
-    for field, info in properties.items():
-        is_req = "*" if field in required else " "
-        f_type = info.get("type", "any")
-        desc = info.get("description", "")
-        click.echo(f"{is_req} {field.ljust(20)} | {f_type.ljust(10)} | {desc}")
+    return schema.get("properties", {}), frozenset(schema.get("required", []))
+
+def _print_schema(model):
+    """Helper to print Pydantic model fields in a human-readable way."""
+    properties, required = _get_schema(model)
+
+    lines = [
+        f"{'*' if field in required else ' '} {field:<20} | {info.get('type', 'any'):<10} | {info.get('description', '')}"
+        for field, info in properties.items()
+    ]
+    if lines:
+        click.echo("\n".join(lines))
 
 if __name__ == "__main__":
     cli()
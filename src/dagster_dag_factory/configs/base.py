@@ -1,7 +1,59 @@
-from pydantic import ConfigDict
+import re
+from dataclasses import asdict, is_dataclass
+from enum import Enum
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict
 from dagster import Config
-from typing import Any, List, ClassVar
-import json
+from collections import deque
+from typing import Any, Dict, List, ClassVar, Iterable, Literal, Optional, get_args, get_origin
+import orjson
+
+
+@lru_cache(maxsize=None)
+def _compile_mask_pattern(tokens: tuple) -> "re.Pattern":
+    return re.compile("|".join(map(re.escape, tokens)))
+
+
+def mask_pattern(mask_fields: Iterable[str]) -> "re.Pattern":
+    """
+    Returns a compiled matcher for keys containing any of the mask tokens.
+    Patterns are cached per token set, so each class compiles its list once.
+    """
+    return _compile_mask_pattern(tuple(sorted({m.lower() for m in mask_fields})))
+
+
+_SCALAR_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+def _may_hold_masked(annotation: Any, search) -> bool:
+    """
+    True if a field of this type could carry a key matching the mask pattern.
+    Anything open-ended (dicts, Any, models accepting extra keys) counts.
+    """
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return False
+    if origin is not None:
+        return any(_may_hold_masked(arg, search) for arg in get_args(annotation))
+    if not isinstance(annotation, type):
+        return True
+    if issubclass(annotation, _SCALAR_TYPES + (Enum,)):
+        return False
+    if issubclass(annotation, BaseModel):
+        if annotation.model_config.get("extra") == "allow":
+            return True
+        return any(
+            search(name.lower()) is not None or _may_hold_masked(f.annotation, search)
+            for name, f in annotation.model_fields.items()
+        )
+    return True
+
+
+def _is_nested(value: Any) -> bool:
+    """True for values the masking walk must descend into."""
+    return isinstance(value, (dict, list, BaseModel)) or (
+        is_dataclass(value) and not isinstance(value, type)
+    )
 
 
 class BaseConfigModel(Config):
@@ -28,24 +80,84 @@ class BaseConfigModel(Config):
     # Sensible defaults for sensitive fields to mask in logs
     mask_fields: ClassVar[List[str]] = ["password", "secret", "token", "token_file"]
 
-    def to_masked_dict(self) -> dict:
-        """Returns a dictionary with sensitive fields masked."""
-        data = self.model_dump()
-        return self._recursive_mask(data)
-
-    def _recursive_mask(self, data: Any) -> Any:
-        if isinstance(data, dict):
-            new_data = {}
-            for k, v in data.items():
-                if any(m in k.lower() for m in self.mask_fields):
-                    new_data[k] = "******" if v else v
-                else:
-                    new_data[k] = self._recursive_mask(v)
-            return new_data
-        elif isinstance(data, list):
-            return [self._recursive_mask(x) for x in data]
-        return data
+    # Set per class at definition time: False when no declared field can hold a masked key
+    _has_masked_fields: ClassVar[bool] = True
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        search = mask_pattern(cls.mask_fields).search
+        cls._has_masked_fields = any(
+            search(name.lower()) is not None or _may_hold_masked(f.annotation, search)
+            for name, f in cls.model_fields.items()
+        )
+
+    def to_masked_dict(self, inherited_mask_fields: Iterable[str] = ()) -> dict:
+        """
+        Returns a dictionary with sensitive fields masked.
+        Walks the live model once instead of masking a full model_dump() copy.
+        inherited_mask_fields are the enclosing model's tokens; they apply here
+        on top of this model's own mask_fields.
+        """
+        own = {m.lower() for m in self.mask_fields}
+        tokens = own.union(m.lower() for m in inherited_mask_fields)
+        # Nothing to mask unless a field can carry sensitive keys or extras were set
+        if tokens == own and not type(self)._has_masked_fields and not self.__pydantic_extra__:
+            return self.model_dump()
+
+        data = {name: getattr(self, name) for name in type(self).model_fields}
+        if self.__pydantic_extra__:
+            data.update(self.__pydantic_extra__)
+        return self._recursive_mask(data, tokens)
+
+    def _recursive_mask(self, data: Any, mask_fields: Optional[Iterable[str]] = None) -> Any:
+        """Masks sensitive keys in nested dicts/lists using an explicit stack (no recursion)."""
+        if mask_fields is None:
+            mask_fields = self.mask_fields
+        search = mask_pattern(mask_fields).search
+        # Config keys repeat across nested dicts, so remember each key's verdict
+        verdicts: Dict[Any, bool] = {}
+
+        root = [data]
+        stack = deque([(root, 0, data)])
+        while stack:
+            parent, slot, value = stack.pop()
+            # Nested models are dumped lazily, only where they occur, and keep
+            # masking everything the enclosing model masks
+            if isinstance(value, BaseConfigModel):
+                parent[slot] = value.to_masked_dict(mask_fields)
+                continue
+            if isinstance(value, BaseModel):
+                value = value.model_dump()
+            elif is_dataclass(value) and not isinstance(value, type):
+                value = asdict(value)
+
+            if isinstance(value, dict):
+                new_data = {}
+                parent[slot] = new_data
+                for k, v in value.items():
+                    masked = verdicts.get(k)
+                    if masked is None:
+                        lk = k.lower() if isinstance(k, str) else ""
+                        masked = verdicts[k] = search(lk) is not None
+                    if masked:
+                        new_data[k] = "******" if v else v
+                    else:
+                        new_data[k] = v
+                        if _is_nested(v):
+                            stack.append((new_data, k, v))
+            elif isinstance(value, list):
+                new_list = list(value)
+                parent[slot] = new_list
+                for i, v in enumerate(value):
+                    if _is_nested(v):
+                        stack.append((new_list, i, v))
+        return root[0]
 
     def to_masked_json(self) -> str:
         """Returns a pretty-printed JSON string of the masked configuration."""
-        return json.dumps(self.to_masked_dict(), indent=2, default=str)
+        return orjson.dumps(
+            self.to_masked_dict(),
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        ).decode()
@@ -79,3 +79,9 @@ OPRN_TYPE_TO_KIND = {
     OperationType.SFTP: "file",  # Dagster may not have SFTP icon, use generic file icon
     OperationType.POSTGRES: DagsterKind.POSTGRES
 }
+
+# Same mapping flattened to plain strings (type -> kind tag) for hot-path lookups
+OPRN_TYPE_TO_KIND_STR = {
+    oprn_type.value: kind.value if isinstance(kind, Enum) else kind
+    for oprn_type, kind in OPRN_TYPE_TO_KIND.items()
+}
@@ -1,4 +1,4 @@
-from typing import Optional, List, ClassVar
+from typing import Dict, Optional, List, ClassVar, Tuple, Type
 from pydantic import Field
 from dagster_dag_factory.configs.base import BaseConfigModel
 from dagster_dag_factory.configs.compression import CompressConfig
@@ -28,6 +28,13 @@ class S3Config(BaseConfigModel):
         "json_options",
     ]
 
+    # object_type -> (options field, default options class) filled in by model_post_init
+    _DEFAULT_OPTIONS: ClassVar[Dict[S3ObjectType, Tuple[str, Type[BaseConfigModel]]]] = {
+        S3ObjectType.CSV: ("csv_options", CsvConfig),
+        S3ObjectType.PARQUET: ("parquet_options", ParquetConfig),
+        S3ObjectType.JSON: ("json_options", JSONOption),
+    }
+
     bucket_name: str = Field(description="The name of the S3 bucket")
     key: Optional[str] = Field(default=None, description="S3 Key/Path")
     region: Optional[str] = Field(default=None, description="The AWS region")
@@ -84,9 +91,8 @@ class S3Config(BaseConfigModel):
             self.predicate_template = "{{ " + self.predicate + " }}"
 
         # Ensure sub-configs are initialized if they match the object_type (Framework pattern)
-        if self.object_type == S3ObjectType.CSV and not self.csv_options:
-            self.csv_options = CsvConfig()
-        elif self.object_type == S3ObjectType.PARQUET and not self.parquet_options:
-            self.parquet_options = ParquetConfig()
-        elif self.object_type == S3ObjectType.JSON and not self.json_options:
-            self.json_options = JSONOption()
+        default_option = self._DEFAULT_OPTIONS.get(self.object_type)
+        if default_option:
+            attr, option_cls = default_option
+            if not getattr(self, attr):
+                setattr(self, attr, option_cls())
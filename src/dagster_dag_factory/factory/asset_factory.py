@@ -6,22 +6,29 @@ from dagster import (
     AssetIn,
     SourceAsset,
     AssetKey,
+    MetadataValue,
     Config,
     MultiPartitionKey,
-    MetadataValue,
 )
-import json
-import yaml
+import functools
+import logging
+import orjson
+import re
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Type
-from pydantic import create_model
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple, Type
+from pydantic import BaseModel, create_model
 from dagster_dag_factory.factory.registry import OperatorRegistry
-
-# Import operators package to start registration
-import dagster_dag_factory.operators as _operators  # noqa: F401
 from dagster_dag_factory.factory.partition_factory import PartitionFactory
-from dagster_dag_factory.factory.helpers.rendering import render_config
+from dagster_dag_factory.factory.helpers.rendering import (
+    CompiledConfig,
+    render_config,
+)
 from dagster_dag_factory.factory.helpers.config_loaders import load_env_vars
+from dagster_dag_factory.factory.helpers.yaml_loader import (
+    disk_cache_dir,
+    iter_yaml_files,
+    load_yaml_files,
+)
 from dagster_dag_factory.factory.helpers.env_accessor import EnvVarAccessor
 from dagster_dag_factory.factory.helpers.dynamic import Dynamic
 from dagster_dag_factory.factory.helpers.macros import get_macros
@@ -38,22 +45,84 @@ from dagster_dag_factory.factory.helpers.dagster_helpers import (
     get_freshness_policy,
     get_retry_policy,
 )
-from dagster_dag_factory.configs.enums import DagsterKind, OPRN_TYPE_TO_KIND, OperationType
+from dagster_dag_factory.configs.enums import DagsterKind, OPRN_TYPE_TO_KIND_STR, OperationType
 from dagster_dag_factory.utils.exceptions import DagsterFactoryError
 
+logger = logging.getLogger("dagster_dag_factory")
+
+_PYTHON_KIND = DagsterKind.PYTHON.value
+
+
+def _fields_set(model: BaseModel) -> Dict[str, Any]:
+    """
+    Equivalent of model.model_dump(exclude_unset=True) that only touches the
+    fields that were set; nested models are still dumped (unset fields excluded).
+    """
+    overrides = {}
+    for name in model.model_fields_set:
+        value = getattr(model, name)
+        if isinstance(value, (BaseModel, list, tuple, dict)):
+            # Containers may hold models; let pydantic dump just this field
+            value = model.model_dump(include={name}, exclude_unset=True)[name]
+        overrides[name] = value
+    return overrides
+
+
+@functools.lru_cache(maxsize=None)
+def _build_dynamic_config(
+    operator_class: type,
+    source_schema: Optional[Type[Config]],
+    target_schema: Optional[Type[Config]],
+) -> Type[Config]:
+    """
+    Builds the runtime-override config class for an operator. Its shape only
+    depends on the operator's schemas, so the class (and its pydantic-core
+    validator) is created once per operator rather than once per asset.
+    We use pydantic.create_model to ensure the class is correctly initialized
+    with all metadata needed for Dagster's inspection engine.
+    """
+    model_fields = {}
+
+    if source_schema:
+        model_fields["source"] = (Optional[source_schema], None)
+
+    if target_schema:
+        model_fields["target"] = (Optional[target_schema], None)
+
+    model_fields["max_workers"] = (Optional[int], None)
+
+    # Qualified so same-named operators from different modules (e.g. a user
+    # class shadowing a built-in) get distinct Dagster config type names
+    qualified_name = f"{operator_class.__module__}.{operator_class.__qualname__}"
+    return create_model(
+        re.sub(r"\W", "_", qualified_name) + "_config",
+        **model_fields,
+        __base__=Config,
+        __module__=__name__
+    )
+
 
 class AssetFactory:
     def __init__(self, base_dir: Path):
         self.base_dir = Path(base_dir)
         self.env_vars = load_env_vars(self.base_dir)
+        # Run-independent template vars, built once instead of per execution
+        self._vars_dynamic = Dynamic(self.env_vars)
+        self._env_accessor = EnvVarAccessor()
+        # Assets sharing a connection pair share one required_resource_keys set
+        self._required_resources: Dict[Tuple[str, ...], FrozenSet[str]] = {}
 
     def load_assets(self):
         all_defs = []
         defs_dir = self.base_dir / "defs"
-        for yaml_file in defs_dir.rglob("*.yaml"):
+        # Files are read/parsed concurrently; Dagster definitions are built here,
+        # on the calling thread, in discovery order.
+        for yaml_file, config, load_error in load_yaml_files(
+            iter_yaml_files(defs_dir), cache_dir=disk_cache_dir()
+        ):
             try:
-                with open(yaml_file) as f:
-                    config = yaml.safe_load(f)
+                if load_error is not None:
+                    raise load_error
 
                 if not config:
                     continue
@@ -66,24 +135,20 @@ class AssetFactory:
                                 all_defs.extend(asset_defs)
                             else:
                                 all_defs.append(asset_defs)
-                        except Exception as e:
-                            print(
-                                f"ERROR: Failed to create asset from {yaml_file}: {e}"
-                            )
-                            raise e
+                        except Exception:
+                            logger.exception("Failed to create asset from %s", yaml_file)
+                            raise
 
                 if "source_assets" in config:
                     for sa_conf in config["source_assets"]:
                         try:
                             all_defs.append(self._create_source_asset(sa_conf))
-                        except Exception as e:
-                            print(
-                                f"ERROR: Failed to create source asset from {yaml_file}: {e}"
-                            )
-                            raise e
-            except Exception as e:
-                print(f"ERROR: Critical failure loading {yaml_file}: {e}")
-                raise e
+                        except Exception:
+                            logger.exception("Failed to create source asset from %s", yaml_file)
+                            raise
+            except Exception:
+                logger.exception("Critical failure loading %s", yaml_file)
+                raise
         return all_defs
 
     def _create_source_asset(self, config: Dict[str, Any]) -> SourceAsset:
@@ -130,8 +195,8 @@ class AssetFactory:
             template_vars["partition_key"] = None
 
         # Add vars, env, and run_tags
-        template_vars["vars"] = Dynamic(self.env_vars)
-        template_vars["env"] = EnvVarAccessor()
+        template_vars["vars"] = self._vars_dynamic
+        template_vars["env"] = self._env_accessor
         run_tags = context.run.tags if hasattr(context, "run") else {}
         template_vars["run_tags"] = Dynamic(run_tags)
         
@@ -140,7 +205,7 @@ class AssetFactory:
         trigger_tag = run_tags.get("factory/trigger")
         if trigger_tag:
             try:
-                parsed = json.loads(trigger_tag)
+                parsed = orjson.loads(trigger_tag)
                 template_vars["trigger"] = Dynamic(parsed)
             except Exception:
                 pass
@@ -148,15 +213,24 @@ class AssetFactory:
         template_vars.update(get_macros(context))
         return template_vars
 
-        template_vars.update(get_macros(context))
-
-        return template_vars
+    def _run_check(
+        self,
+        operator,
+        compiled_conf: CompiledConfig,
+        asset_key: AssetKey,
+        context: AssetCheckExecutionContext,
+    ):
+        template_vars = self._get_template_vars(context)
+        rendered_conf = compiled_conf.render(template_vars)
+        # Pass asset_key to the check object
+        rendered_conf["_asset_key"] = asset_key
+        return operator.execute_check(context, rendered_conf)
 
     def _create_checks(
         self,
         asset_key: AssetKey,
         config_list: List[Dict[str, Any]],
-        required_resources: set,
+        required_resources: FrozenSet[str],
         operator,
     ):
         checks = []
@@ -169,17 +243,15 @@ class AssetFactory:
             if "connection" in check_conf:
                 check_resources.add(check_conf["connection"])
 
-            @asset_check(
+            # One shared check body; only the bound arguments differ per check.
+            # The check config is compiled here, at build time.
+            return asset_check(
                 asset=asset_key, name=check_name, required_resource_keys=check_resources
+            )(
+                functools.partial(
+                    self._run_check, operator, CompiledConfig(check_conf), asset_key
+                )
             )
-            def _generated_check(context: AssetCheckExecutionContext):
-                template_vars = self._get_template_vars(context)
-                rendered_conf = render_config(check_conf, template_vars)
-                # Pass asset_key to the check object
-                rendered_conf["_asset_key"] = asset_key
-                return operator.execute_check(context, rendered_conf)
-
-            return _generated_check
 
         for conf in config_list:
             check_def = make_check(conf)
@@ -203,7 +275,8 @@ class AssetFactory:
         tags = asset_conf.get("tags") or {}
 
         # Dagster's plotting engine (Chart.js) ignores JSON metadata, preventing the 'category' scale crash.
-        ui_config = {k: v for k, v in asset_conf.items() if k != "metadata"}
+        ui_config = dict(asset_conf)
+        ui_config.pop("metadata", None)
         metadata["Asset Config"] = MetadataValue.json(ui_config)
 
         # Concurrency support
@@ -239,14 +312,16 @@ class AssetFactory:
             ins[dep_name] = AssetIn(partition_mapping=partition_mapping)
 
         # Remove assets in 'ins' from 'deps' to avoid duplication error
-        deps = [d for d in deps if d not in ins]
+        if ins:
+            deps = [d for d in deps if d not in ins]
 
         # Determine required resources
-        required_resources = set()
-        if "connection" in source:
-            required_resources.add(source["connection"])
-        if "connection" in target:
-            required_resources.add(target["connection"])
+        connections = tuple(
+            conf["connection"] for conf in (source, target) if "connection" in conf
+        )
+        required_resources = self._required_resources.get(connections)
+        if required_resources is None:
+            required_resources = self._required_resources[connections] = frozenset(connections)
 
         # Prepare asset arguments
         asset_kwargs = {
@@ -265,23 +340,16 @@ class AssetFactory:
         
         # Asset Kinds (UI Icons)
         # We automatically infer the technology kinds from the source and target types
-        # using the centralized OPRN_TYPE_TO_KIND mapping.
+        # using the centralized OPRN_TYPE_TO_KIND mapping (pre-flattened to strings).
         source_type_str = source.get("type", "").upper()
         target_type_str = target.get("type", "").upper()
         
-        kinds = set()
-        for type_str in [source_type_str, target_type_str]:
-            if type_str:
-                # Look up the kind from the centralized mapping
-                kind_value = OPRN_TYPE_TO_KIND.get(type_str)
-                if kind_value:
-                    # Handle both enum objects and plain strings
-                    if hasattr(kind_value, 'value'):
-                        kinds.add(kind_value.value)
-                    else:
-                        kinds.add(kind_value)
-        # Add python kind (extract string value from enum)
-        kinds.add(DagsterKind.PYTHON.value)
+        kinds = {
+            OPRN_TYPE_TO_KIND_STR[type_str]
+            for type_str in (source_type_str, target_type_str)
+            if type_str in OPRN_TYPE_TO_KIND_STR
+        }
+        kinds.add(_PYTHON_KIND)
         asset_kwargs["kinds"] = kinds
         if backfill_policy:
             asset_kwargs["backfill_policy"] = backfill_policy
@@ -310,8 +378,8 @@ class AssetFactory:
 
             return [asset(**asset_kwargs)(_generated_asset)]
         else:
-            # Instantiate operator
-            operator = operator_class()
+            # Shared operator instance (stateless operators are reused across assets)
+            operator = OperatorRegistry.get_operator_instance(source_type, target_type)
 
             # Strict Build-Phase Validation (Discovery time structural check)
             if operator.source_config_schema:
@@ -345,67 +413,61 @@ class AssetFactory:
 
 
 
-            # Generate dynamic config class for this asset (Option B V2)
-            # We use pydantic.create_model to ensure the class is correctly initialized
-            # with all metadata needed for Dagster's inspection engine.
-            class_name = f"{name}_config".replace("-", "_")
-            model_fields = {}
-            
-            if operator.source_config_schema:
-                model_fields["source"] = (Optional[operator.source_config_schema], None)
-            
-            if operator.target_config_schema:
-                model_fields["target"] = (Optional[operator.target_config_schema], None)
-            
-            model_fields["max_workers"] = (Optional[int], None)
-            
-            DynamicConfig = create_model(
-                class_name,
-                **model_fields,
-                __base__=Config,
-                __module__=__name__
+            # Dynamic run config class (Option B V2), shared by every asset of this operator
+            DynamicConfig = _build_dynamic_config(
+                operator_class,
+                operator.source_config_schema,
+                operator.target_config_schema,
             )
 
 
-            def logic(context, source_conf, target_conf, max_workers, runtime_config: Config, operator=operator):
+            # Everything derived from the static asset config is resolved once,
+            # at build time; each run only renders and validates.
+            compiled_source = CompiledConfig(source.get("configs", source))
+            compiled_target = CompiledConfig(target.get("configs", target))
+            source_conn_name = source.get("connection")
+            target_conn_name = target.get("connection")
+            source_schema = operator.source_config_schema
+            target_schema = operator.target_config_schema
+            max_workers = asset_conf.get("max_workers", 5)
+
+            def logic(context, runtime_config: Config):
                 template_vars = self._get_template_vars(context)
 
                 # Resolve Resources
-                source_conn_name = source_conf.get("connection")
-                target_conn_name = target_conf.get("connection")
-
                 source_res = getattr(context.resources, source_conn_name) if source_conn_name else None
                 target_res = getattr(context.resources, target_conn_name) if target_conn_name else None
 
-                # 1. Load static YAML config payload
-                source_payload = source_conf.get("configs", source_conf).copy()
-                target_payload = target_conf.get("configs", target_conf).copy()
+                # 1. The static YAML config payloads were compiled at build time;
+                # per-run additions are layered on top of the rendered result.
+                source_extra = {}
+                target_extra = {}
 
                 # 🟢 Inject trigger (automatically hydrated from run tags)
                 if template_vars.get("trigger"):
-                    source_payload["trigger"] = template_vars["trigger"]
+                    source_extra["trigger"] = template_vars["trigger"]
                     # Also provide 'source.trigger' for YAML access during immediate rendering
                     template_vars["source"] = Dynamic({"trigger": template_vars["trigger"]})
                 
                 # 2. Merge Runtime Overrides (Option B) if provided in UI
                 if hasattr(runtime_config, "source") and runtime_config.source:
                     # Merge only fields that were actually set in the UI
-                    overrides = runtime_config.source.model_dump(exclude_unset=True)
-                    source_payload.update(overrides)
+                    source_extra.update(_fields_set(runtime_config.source))
                 
                 if hasattr(runtime_config, "target") and runtime_config.target:
-                    overrides = runtime_config.target.model_dump(exclude_unset=True)
-                    target_payload.update(overrides)
+                    target_extra.update(_fields_set(runtime_config.target))
 
                 # Render source
-                rendered_source = render_config(source_payload, template_vars)
+                rendered_source = compiled_source.render(template_vars)
+                if source_extra:
+                    rendered_source.update(render_config(source_extra, template_vars))
                 if "connection" not in rendered_source and source_conn_name:
                     rendered_source["connection"] = source_conn_name
 
                 # Validate source
-                if operator.source_config_schema:
+                if source_schema:
                     try:
-                        source_model = operator.source_config_schema(**rendered_source)
+                        source_model = source_schema(**rendered_source)
                         template_vars["source"] = source_model
                     except Exception as e:
                         context.log.error(f"Source configuration validation failed: {e}")
@@ -416,14 +478,16 @@ class AssetFactory:
                     source_model = dynamic_source
 
                 # Render target
-                rendered_target = render_config(target_payload, template_vars)
+                rendered_target = compiled_target.render(template_vars)
+                if target_extra:
+                    rendered_target.update(render_config(target_extra, template_vars))
                 if "connection" not in rendered_target and target_conn_name:
                     rendered_target["connection"] = target_conn_name
 
                 # Validate target
-                if operator.target_config_schema:
+                if target_schema:
                     try:
-                        target_model = operator.target_config_schema(**rendered_target)
+                        target_model = target_schema(**rendered_target)
                     except Exception as e:
                         context.log.error(f"Target configuration validation failed: {e}")
                         raise
@@ -451,17 +515,16 @@ class AssetFactory:
                 return None
 
             def _generated_asset(context: AssetExecutionContext, config: DynamicConfig):
-                source = asset_conf.get("source", {})
-                target = asset_conf.get("target", {})
-                max_workers = asset_conf.get("max_workers", 5)
-                
-                return logic(context, source, target, max_workers, config)
-
-            # Create checks using the operator instance
-            checks = self._create_checks(
-                AssetKey(name), asset_conf.get("checks", []), required_resources, operator
-            )
+                return logic(context, config)
 
             assets.append(asset(**asset_kwargs)(_generated_asset))
-            assets.extend(checks)
+
+            # Create checks using the operator instance (most assets define none)
+            checks_conf = asset_conf.get("checks")
+            if checks_conf:
+                assets.extend(
+                    self._create_checks(
+                        AssetKey(name), checks_conf, required_resources, operator
+                    )
+                )
             return assets
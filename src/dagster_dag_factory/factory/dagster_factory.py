@@ -1,5 +1,8 @@
+import functools
+import logging
+import os
 from pathlib import Path
-import yaml
+from typing import Optional
 import warnings
 from dagster import Definitions, AssetsDefinition, AssetChecksDefinition, BetaWarning
 from dagster_dag_factory.factory.asset_factory import AssetFactory
@@ -7,13 +10,37 @@ from dagster_dag_factory.factory.resource_factory import ResourceFactory
 from dagster_dag_factory.factory.job_factory import JobFactory
 from dagster_dag_factory.factory.schedule_factory import ScheduleFactory
 from dagster_dag_factory.factory.sensor_factory import SensorFactory
-from dagster_dag_factory.factory.utils.logging import log_header, log_action, log_action_stats, log_marker
+from dagster_dag_factory.factory.helpers.yaml_loader import (
+    disk_cache_dir,
+    iter_yaml_files,
+    load_yaml_files,
+)
+from dagster_dag_factory.factory.utils.logging import (
+    info_enabled,
+    log_action,
+    log_action_stats,
+    log_header,
+    log_marker,
+)
 import time
 
+logger = logging.getLogger("dagster_dag_factory")
+
 # Suppress beta warnings for backfill_policy and other features
 warnings.filterwarnings("ignore", category=BetaWarning)
 
 
+@functools.lru_cache(maxsize=None)
+def _definition_kind(item_type: type) -> Optional[str]:
+    """Classifies a definition class once: 'check', 'asset' or None."""
+    # AssetChecksDefinition inherits from AssetsDefinition, so check it first
+    if issubclass(item_type, AssetChecksDefinition):
+        return "check"
+    if issubclass(item_type, AssetsDefinition):
+        return "asset"
+    return None
+
+
 class DagsterFactory:
     def __init__(self, base_dir: Path, verbose_build: bool = None):
         self.base_dir = Path(base_dir)
@@ -24,16 +51,25 @@ class DagsterFactory:
         self.sensor_factory = SensorFactory()
         self.verbose_build = verbose_build
 
-    def build_definitions(self) -> Definitions:
-        import os
-        
         # Decide whether to show build logs
         # True: always, False: never, None: skip if in a Dagster worker process
-        show_logs = self.verbose_build
-        if show_logs is None:
+        self._show_logs = verbose_build
+        if self._show_logs is None:
             # Silence logs in Dagster worker processes (Run or Step workers)
             is_worker = "DAGSTER_RUN_ID" in os.environ or "DAGSTER_STEP_KEY" in os.environ
-            show_logs = not is_worker
+            self._show_logs = not is_worker
+
+    @property
+    def defs_dir(self) -> Path:
+        """Definitions directory: 'pipelines' when present, otherwise 'defs'."""
+        defs_dir = self.base_dir / "pipelines"
+        if not defs_dir.exists():
+            defs_dir = self.base_dir / "defs"
+        return defs_dir
+
+    def build_definitions(self) -> Definitions:
+        # Build logs go to the package logger; skip formatting them when it drops INFO
+        show_logs = self._show_logs and info_enabled()
 
         start_time = time.time()
         if show_logs:
@@ -50,24 +86,27 @@ class DagsterFactory:
         assets = []
         asset_checks = []
         jobs_config = []
+        jobs_by_name = {}  # job name -> job configs, for schedule resolution
         schedules_config = []
         sensors_config = []
         asset_partitions = {}  # Track partitions per asset
 
         # Determine definitions directory (support both 'pipelines' and 'defs')
-        defs_dir = self.base_dir / "pipelines"
-        if not defs_dir.exists():
-            defs_dir = self.base_dir / "defs"
+        defs_dir = self.defs_dir
 
-        # Iterate YAMLs and separate assets from checks
-        for yaml_file in defs_dir.rglob("*.yaml"):
+        # Iterate YAMLs and separate assets from checks. Files are read/parsed
+        # concurrently; definitions are built here, in discovery order.
+        for yaml_file, config, load_error in load_yaml_files(
+            iter_yaml_files(defs_dir), cache_dir=disk_cache_dir()
+        ):
             file_assets = 0
             file_jobs = 0
             file_sensors = 0
             
             try:
-                with open(yaml_file) as f:
-                    config = yaml.safe_load(f) or {}
+                if load_error is not None:
+                    raise load_error
+                config = config or {}
 
                 if "assets" in config:
                     for asset_conf in config["assets"]:
@@ -77,15 +116,16 @@ class DagsterFactory:
                                 items = [items]
 
                             for item in items:
-                                # AssetChecksDefinition inherits from AssetsDefinition, so check it first
-                                if isinstance(item, AssetChecksDefinition):
+                                kind = _definition_kind(type(item))
+                                if kind == "check":
                                     asset_checks.append(item)
-                                elif isinstance(item, AssetsDefinition):
+                                elif kind == "asset":
                                     assets.append(item)
                                     file_assets += 1
+                                    user_key = item.key.to_user_string()
                                     # Store partition info for later use in schedules
                                     if item.partitions_def:
-                                        asset_partitions[item.key.to_user_string()] = (
+                                        asset_partitions[user_key] = (
                                             item.partitions_def
                                         )
 
@@ -103,11 +143,13 @@ class DagsterFactory:
                                         )
                                         # We also need to ensure a job exists for this asset if it doesn't already
                                         # The job_factory will create it if we add it to jobs_config
-                                        jobs_config.append(
-                                            {
-                                                "name": f"{asset_conf['name']}_job",
-                                                "selection": [item.key.to_user_string()],
-                                            }
+                                        asset_job_conf = {
+                                            "name": f"{asset_conf['name']}_job",
+                                            "selection": [user_key],
+                                        }
+                                        jobs_config.append(asset_job_conf)
+                                        jobs_by_name.setdefault(asset_job_conf["name"], []).append(
+                                            asset_job_conf
                                         )
                         except Exception as e:
                             # Enhance exception with file name before re-raising
@@ -125,6 +167,7 @@ class DagsterFactory:
                     for job_conf in config["jobs"]:
                         try:
                             jobs_config.append(job_conf)
+                            jobs_by_name.setdefault(job_conf.get("name"), []).append(job_conf)
                             file_jobs += 1
 
                             # Determine if this job is partitioned
@@ -154,8 +197,8 @@ class DagsterFactory:
                         except Exception as e:
                             if show_logs:
                                 log_action("LOAD_FAILED", file=yaml_file.name, error=str(e))
-                                print(f"ERROR: Failed to process job from {yaml_file}: {e}")
-                            raise e
+                                logger.exception("Failed to process job from %s", yaml_file)
+                            raise
 
                 if "schedules" in config:
                     for s_conf in config["schedules"]:
@@ -164,17 +207,16 @@ class DagsterFactory:
                         is_p = False
                         p_d = None
                         if s_job_name:
-                            # Search for the job config to find its selection
-                            for j_c in jobs_config:
-                                if j_c["name"] == s_job_name:
-                                    j_sel = j_c.get("selection", [])
-                                    if isinstance(j_sel, str):
-                                        j_sel = [j_sel]
-                                    for a_n in j_sel:
-                                        if a_n in asset_partitions:
-                                            is_p = True
-                                            p_d = asset_partitions[a_n]
-                                            break
+                            # Look up the job config(s) to find their selection
+                            for j_c in jobs_by_name.get(s_job_name, ()):
+                                j_sel = j_c.get("selection", [])
+                                if isinstance(j_sel, str):
+                                    j_sel = [j_sel]
+                                for a_n in j_sel:
+                                    if a_n in asset_partitions:
+                                        is_p = True
+                                        p_d = asset_partitions[a_n]
+                                        break
 
                         s_conf["is_partitioned"] = is_p
                         s_conf["partitions_def"] = p_d
@@ -1,7 +1,9 @@
 from typing import Optional, Dict, Any
 from dagster import AutoMaterializePolicy
+from dagster_dag_factory.factory.helpers.dagster_helpers import memoize_config
 
 
+@memoize_config
 def get_auto_materialize_policy(
     config: Optional[Dict[str, Any]],
 ) -> Optional[AutoMaterializePolicy]:
@@ -1,16 +1,20 @@
 import os
-import yaml
 from typing import Dict, Any
 from pathlib import Path
+from dagster_dag_factory.factory.helpers.yaml_loader import load_yaml_cached
 
 
 def _deep_merge(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
-    """Recursively merges two dictionaries."""
-    for key, value in overrides.items():
-        if isinstance(value, dict) and key in base and isinstance(base[key], dict):
-            _deep_merge(base[key], value)
-        else:
-            base[key] = value
+    """Deep-merges overrides into base (in place), walking nested dicts with an explicit stack."""
+    stack = [(base, overrides)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(value, dict) and isinstance(current, dict):
+                stack.append((current, value))
+            else:
+                target[key] = value
     return base
 
 
@@ -25,16 +29,14 @@ def load_env_config(directory: Path) -> Dict[str, Any]:
     # 1. Load common.yaml
     common_path = directory / "common.yaml"
     if common_path.exists():
-        with open(common_path) as f:
-            common_vars = yaml.safe_load(f) or {}
-            _deep_merge(all_config, common_vars)
+        common_vars = load_yaml_cached(common_path) or {}
+        _deep_merge(all_config, common_vars)
 
     # 2. Load env specific
     env_path = directory / f"{env}.yaml"
     if env_path.exists():
-        with open(env_path) as f:
-            env_vars = yaml.safe_load(f) or {}
-            _deep_merge(all_config, env_vars)
+        env_vars = load_yaml_cached(env_path) or {}
+        _deep_merge(all_config, env_vars)
 
     return all_config
 
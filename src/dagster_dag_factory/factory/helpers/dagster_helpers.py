@@ -1,4 +1,5 @@
-from typing import Optional, Dict, Any
+import functools
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
 from dagster import (
     BackfillPolicy,
     AutoMaterializePolicy,
@@ -12,7 +13,48 @@ from dagster import (
 )
 from dagster_dag_factory.factory.helpers.dagster_compat import FreshnessPolicy
 
+T = TypeVar("T")
 
+
+def freeze_config(value: Any) -> Hashable:
+    """
+    Converts a parsed YAML value into a hashable key. Dicts become frozensets of
+    items and lists become tuples; leaves carry their type so that 1, 1.0 and
+    True stay distinct keys.
+    """
+    if isinstance(value, dict):
+        return frozenset((k, freeze_config(v)) for k, v in value.items())
+    elif isinstance(value, list):
+        return tuple(freeze_config(v) for v in value)
+    return (type(value), value)
+
+
+def memoize_config(fn: Callable[[Any], T]) -> Callable[[Any], T]:
+    """
+    Memoizes a builder that turns a raw YAML value (usually a dict) into an
+    (immutable) Dagster object, so assets sharing a policy config share one
+    instance. Values that cannot be frozen are built uncached, so the builder's
+    own validation still reports them; errors are never cached.
+    """
+    cache: Dict[Hashable, T] = {}
+
+    @functools.wraps(fn)
+    def wrapper(config):
+        if not config:
+            return fn(config)
+        try:
+            key = freeze_config(config)
+            return cache[key]
+        except TypeError:
+            return fn(config)
+        except KeyError:
+            result = cache[key] = fn(config)
+            return result
+
+    return wrapper
+
+
+@memoize_config
 def get_backfill_policy(config: Optional[Dict[str, Any]]) -> Optional[BackfillPolicy]:
     if not config:
         return None
@@ -25,6 +67,7 @@ def get_backfill_policy(config: Optional[Dict[str, Any]]) -> Optional[BackfillPo
     return None
 
 
+@memoize_config
 def get_partition_mapping(config: Optional[Dict[str, Any]]):
     if not config:
         return None
@@ -50,6 +93,7 @@ def get_partition_mapping(config: Optional[Dict[str, Any]]):
     return None
 
 
+@memoize_config
 def get_automation_policy(
     policy_name: Optional[str],
 ) -> Optional[AutoMaterializePolicy]:
@@ -62,6 +106,7 @@ def get_automation_policy(
     return None
 
 
+@memoize_config
 def get_freshness_policy(config: Optional[Dict[str, Any]]) -> Optional[FreshnessPolicy]:
     if not config:
         return None
@@ -73,6 +118,7 @@ def get_freshness_policy(config: Optional[Dict[str, Any]]) -> Optional[Freshness
     return FreshnessPolicy(maximum_lag_minutes=float(lag), cron_schedule=cron)
 
 
+@memoize_config
 def get_retry_policy(config: Optional[Dict[str, Any]]) -> Optional[RetryPolicy]:
     if not config:
         return None
@@ -1,3 +1,5 @@
+import os
+
 from dagster import EnvVar
 
 
@@ -15,6 +17,4 @@ class EnvVarAccessor:
 
     def get_raw(self, name: str) -> str:
         """Helper for string interpolation where we need the actual env value."""
-        import os
-
         return os.environ.get(name, f"{{{{env.{name}}}}}")
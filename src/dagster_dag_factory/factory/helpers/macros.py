@@ -1,3 +1,8 @@
+import ast
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Dict, Optional, List, Union
 import pendulum
 from datetime import datetime
@@ -66,7 +71,6 @@ class DateMacros:
     def between_datetime(value: Any, start: Any, end: Any) -> str:
         """Generates SQL 'BETWEEN' for datetimes."""
         # Standard format with milliseconds
-        import pendulum
         s_dt = pendulum.parse(str(start)).format("YYYY-MM-DD HH:mm:ss.SSS")
         e_dt = pendulum.parse(str(end)).format("YYYY-MM-DD HH:mm:ss.SSS")
         return f"{value} BETWEEN '{s_dt}' AND '{e_dt}'"
@@ -158,7 +162,6 @@ class SqlserverMacros:
     @staticmethod
     def to_datetime(value: Any) -> str:
         """Formats a value for SQL Server datetime."""
-        import pendulum
         try:
             dt = pendulum.parse(str(value)) if isinstance(value, str) else value
             # Standard SQL Server format with milliseconds (121)
@@ -173,8 +176,6 @@ class JsonMacros:
         """Parses a JSON string or literal into a Python object."""
         if not value:
             return value
-        import json
-        import ast
         try:
             # Try as literal first (handles single quotes, etc.)
             return ast.literal_eval(str(value))
@@ -187,7 +188,6 @@ class JsonMacros:
     @staticmethod
     def to_str(value: Any) -> str:
         """Serializes a Python object to a JSON string."""
-        import json
         try:
             return json.dumps(value, default=str)
         except:
@@ -198,9 +198,6 @@ class FileMacros:
     @staticmethod
     def read(path: str, context: Optional[Any] = None) -> str:
         """Reads the content of a file."""
-        import os
-        from pathlib import Path
-        
         if not path:
             return ""
             
@@ -220,7 +217,6 @@ class SecretMacros:
     @staticmethod
     def get(key: str, default: Optional[str] = None) -> Optional[str]:
         """Fetches a secret value from environment variables."""
-        import os
         return os.environ.get(key, default)
 
 class AppMacros:
@@ -231,7 +227,6 @@ class AppMacros:
         Formats a filename pattern using a base date.
         Replaces <yyyymmdd>, <yyyy>, <mm>, <dd>, etc.
         """
-        import pendulum
         dt = (
             pendulum.instance(base_date)
             if hasattr(base_date, "isoformat")
@@ -251,7 +246,16 @@ class AppMacros:
         return result
 
 def get_macros(context: Optional[Any] = None) -> Dict[str, Any]:
-    """Returns a dictionary of functions to be exposed in templates."""
+    """
+    Returns a dictionary of functions to be exposed in templates.
+    The helpers are stateless, so they are built once and shared; context-dependent
+    macros would be added here on top of the static set.
+    """
+    return dict(_static_macros())
+
+
+@lru_cache(maxsize=None)
+def _static_macros() -> Dict[str, Any]:
     date_helpers = DateMacros()
     cron_helpers = CronMacros()
     sqlserver_helpers = SqlserverMacros()
@@ -1,5 +1,6 @@
+import functools
 import re
-from typing import Any, Dict, TypeVar
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 from enum import Enum
 from pydantic import BaseModel
 import jinja2
@@ -45,6 +46,65 @@ _jinja_env = jinja2.Environment(
     undefined=jinja2.StrictUndefined,  # Fail on missing variables
 )
 
+# Pattern for exact {{ ... }} matches to return non-string types
+_FULL_MATCH_PATTERN = re.compile(r"\{\{\s*([^}]*)\s*\}\}")
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_template(source: str) -> jinja2.Template:
+    """Compiles a template string once; YAML configs reuse the same strings heavily."""
+    return _jinja_env.from_string(source)
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_expression(source: str):
+    """Compiles a bare Jinja expression (the body of a full {{ ... }} match) once."""
+    return _jinja_env.compile_expression(source)
+
+
+def _render_string(d: str, template_vars: Dict[str, Any]) -> Any:
+    v = d.strip()
+
+    # 1. Full match check for returning raw objects (like EnvVars)
+    if _FULL_MATCH_PATTERN.fullmatch(v):
+        try:
+            # Use jinja to evaluate the expression directly
+            return _compile_expression(v[2:-2].strip())(**template_vars)
+        except Exception:
+            # If evaluation fails or is complex, fall back to string rendering
+            pass
+
+    # 2. String interpolation
+    try:
+        template = _compile_template(d)
+        return template.render(**template_vars)
+    except Exception:
+        # Fallback for complex paths or missing vars
+        return d
+
+
+def _is_template_string(d: Any) -> bool:
+    return (
+        isinstance(d, str)
+        and not hasattr(d, "__enum_cls__")
+        and not isinstance(d, Enum)
+    )
+
+
+_TEMPLATE_MARKERS = ("{{", "{%", "{#")
+
+
+def _is_static_string(d: str) -> bool:
+    """
+    True when Jinja would render d unchanged: no template syntax, and nothing
+    its newline handling rewrites (\r normalisation, trailing-newline strip).
+    """
+    return (
+        not any(marker in d for marker in _TEMPLATE_MARKERS)
+        and "\r" not in d
+        and not d.endswith("\n")
+    )
+
 
 def render_config(d: Any, template_vars: Dict[str, Any]) -> Any:
     """
@@ -54,34 +114,122 @@ def render_config(d: Any, template_vars: Dict[str, Any]) -> Any:
     2. Interpolation: "Path: {{ vars.BASE }}/file" -> returns string
     3. Macros: "{{ fn.date.to_date_nodash(partition_key) }}"
     """
+    handler = _RENDER_HANDLERS.get(type(d))
+    if handler is not None:
+        return handler(d, template_vars)
+
+    # Subclasses (OrderedDict, str-based enums, ...) take the isinstance path
     if isinstance(d, dict):
-        return {k: render_config(v, template_vars) for k, v in d.items()}
+        return _render_dict(d, template_vars)
     elif isinstance(d, list):
-        return [render_config(x, template_vars) for x in d]
-    elif (
-        isinstance(d, str)
-        and not hasattr(d, "__enum_cls__")
-        and not isinstance(d, Enum)
-    ):
-        v = d.strip()
-        # Pattern for exact {{ ... }} matches to return non-string types
-        full_match_pattern = re.compile(r"\{\{\s*([^}]*)\s*\}\}")
+        return _render_list(d, template_vars)
+    elif _is_template_string(d) and not _is_static_string(d):
+        return _render_string(d, template_vars)
+    else:
+        return d
+
+
+def _render_dict(d: Dict[Any, Any], template_vars: Dict[str, Any]) -> Dict[Any, Any]:
+    return {k: render_config(v, template_vars) for k, v in d.items()}
+
+
+def _render_list(d: List[Any], template_vars: Dict[str, Any]) -> List[Any]:
+    return [render_config(x, template_vars) for x in d]
+
 
-        # 1. Full match check for returning raw objects (like EnvVars)
-        if full_match_pattern.fullmatch(v):
+def _render_str(d: str, template_vars: Dict[str, Any]) -> Any:
+    # Exact str only: enum members never reach this handler
+    return d if _is_static_string(d) else _render_string(d, template_vars)
+
+
+# Exact-type dispatch for the node types parsed YAML is made of
+_RENDER_HANDLERS: Dict[type, Callable[[Any, Dict[str, Any]], Any]] = {
+    dict: _render_dict,
+    list: _render_list,
+    str: _render_str,
+}
+
+
+RenderFn = Callable[[Dict[str, Any]], Any]
+
+
+def _copy_static(d: Any) -> Any:
+    """Rebuilds the containers of a marker-free subtree; leaves are shared as-is."""
+    if isinstance(d, dict):
+        return {k: _copy_static(v) for k, v in d.items()}
+    elif isinstance(d, list):
+        return [_copy_static(x) for x in d]
+    return d
+
+
+def _compile_node(d: Any) -> Optional[RenderFn]:
+    """
+    Walks a payload once, returning a render function with the same semantics
+    as render_config, or None when the subtree holds no templates at all (its
+    render is then just a structural copy).
+    """
+    if isinstance(d, dict):
+        items = [(k, v, _compile_node(v)) for k, v in d.items()]
+        if all(fn is None for _, _, fn in items):
+            return None
+        return lambda template_vars: {
+            k: _copy_static(v) if fn is None else fn(template_vars)
+            for k, v, fn in items
+        }
+    elif isinstance(d, list):
+        items = [(x, _compile_node(x)) for x in d]
+        if all(fn is None for _, fn in items):
+            return None
+        return lambda template_vars: [
+            _copy_static(x) if fn is None else fn(template_vars) for x, fn in items
+        ]
+    elif _is_template_string(d) and not _is_static_string(d):
+        return _compile_string(d)
+    else:
+        return None
+
+
+def _compile_string(d: str) -> RenderFn:
+    v = d.strip()
+    expression = None
+    if _FULL_MATCH_PATTERN.fullmatch(v):
+        try:
+            expression = _compile_expression(v[2:-2].strip())
+        except Exception:
+            pass
+    try:
+        template = _compile_template(d)
+    except Exception:
+        template = None
+
+    def render(template_vars: Dict[str, Any]) -> Any:
+        if expression is not None:
             try:
-                # Use jinja to evaluate the expression directly
-                return _jinja_env.compile_expression(v[2:-2].strip())(**template_vars)
+                return expression(**template_vars)
             except Exception:
-                # If evaluation fails or is complex, fall back to string rendering
                 pass
-
-        # 2. String interpolation
+        if template is None:
+            return d
         try:
-            template = _jinja_env.from_string(d)
             return template.render(**template_vars)
         except Exception:
-            # Fallback for complex paths or missing vars
             return d
-    else:
-        return d
+
+    return render
+
+
+class CompiledConfig:
+    """
+    A payload pre-walked into a tree of compiled templates (compile once,
+    render many). render() returns fresh containers on every call.
+    """
+
+    __slots__ = ("payload", "_render")
+
+    def __init__(self, payload: Any):
+        self.payload = payload
+        self._render = _compile_node(payload) or (lambda template_vars: _copy_static(payload))
+
+    def render(self, template_vars: Dict[str, Any]) -> Any:
+        return self._render(template_vars)
+
@@ -0,0 +1,260 @@
+import copy
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+import yaml
+
+# Prefer libyaml's C-backed loader/dumper; fall back to the pure-Python ones
+# when PyYAML was built without libyaml.
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeDumper, SafeLoader
+
+_YAML_CACHE_SIZE = 256
+YAML_SUFFIXES = (".yaml", ".yml")
+# Below this many files, worker-process start-up outweighs parallel parsing
+PRELOAD_MIN_FILES = 64
+
+# Parsed YAML keyed by path -> (mtime_ns, size, config). Bounded LRU.
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+_YAML_CACHE_LOCK = threading.Lock()
+
+
+def iter_yaml_files(root: Union[str, Path]) -> Iterator[Path]:
+    """
+    Yields every .yaml/.yml file under root. Uses os.scandir so names and
+    file types come from the directory listing without extra stat calls.
+    Hidden directories (.git, caches) and __pycache__ are pruned, symlinked
+    directories are not followed, and a missing root yields nothing.
+    """
+    pending = [os.fspath(root)]
+    while pending:
+        directory = pending.pop()
+        try:
+            # Drain and close the listing before yielding, so no directory
+            # handle stays open while callers work on the files
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith(".") and entry.name != "__pycache__":
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(YAML_SUFFIXES):
+                yield Path(entry.path)
+        # Reverse so subdirectories are visited in listing order
+        pending.extend(reversed(subdirs))
+
+
+def load_yaml(path: Union[str, Path]) -> Any:
+    """
+    Parses a YAML file using the fastest available safe loader. The file is read
+    as bytes so libyaml detects the encoding and decodes in C.
+    """
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def dump_yaml(data: Any) -> str:
+    """Serializes plain data to block-style YAML using the fastest available safe dumper."""
+    return yaml.dump(data, Dumper=SafeDumper, default_flow_style=False)
+
+
+def load_yaml_cached(
+    path: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None
+) -> Any:
+    """
+    Parses a YAML file, reusing the previous result while the file's mtime and
+    size are unchanged. Returns a deep copy since callers mutate configs.
+    With cache_dir (see disk_cache_dir), parsed configs are also pickled there
+    so that a fresh process (code-server restart, reload) can skip parsing
+    unchanged files.
+    """
+    key = str(path)
+    st = os.stat(key)
+
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _YAML_CACHE.move_to_end(key)
+            config = cached[2]
+        else:
+            cached = None
+
+    if cached is None:
+        disk_entry = _disk_cache_entry(cache_dir, key) if cache_dir else None
+        hit, config = _read_disk_cache(disk_entry, st) if disk_entry else (False, None)
+        if not hit:
+            config = load_yaml(key)
+            if disk_entry:
+                _write_disk_cache(disk_entry, st, config)
+        _store(key, st.st_mtime_ns, st.st_size, config)
+    return copy.deepcopy(config)
+
+
+def disk_cache_dir() -> Optional[Path]:
+    """
+    Directory for the on-disk parse cache, taken from DAGSTER_FACTORY_DISK_CACHE_DIR.
+    The cache is off when the variable is unset. Entries are pickles and are
+    unpickled on load, so point it at a private directory outside the project
+    tree that only the running user can write.
+    """
+    cache_dir = os.environ.get("DAGSTER_FACTORY_DISK_CACHE_DIR")
+    return Path(cache_dir).expanduser() if cache_dir else None
+
+
+def _disk_cache_entry(cache_dir: Union[str, Path], key: str) -> Path:
+    # One entry per source file, named by a hash of its absolute path; the
+    # stored mtime/size decide whether it is still valid.
+    path_hash = hashlib.blake2b(os.path.abspath(key).encode(), digest_size=16).hexdigest()
+    return Path(cache_dir) / f"{path_hash}.pkl"
+
+
+def _read_disk_cache(entry: Path, st: os.stat_result) -> Tuple[bool, Any]:
+    try:
+        with open(entry, "rb") as f:
+            mtime_ns, size, config = pickle.load(f)
+    except Exception:
+        # Missing, truncated or unreadable entries just mean a re-parse
+        return False, None
+    if mtime_ns != st.st_mtime_ns or size != st.st_size:
+        return False, None
+    return True, config
+
+
+def _write_disk_cache(entry: Path, st: os.stat_result, config: Any) -> None:
+    """Atomically replaces a cache entry (write-then-rename); failures are ignored."""
+    try:
+        entry.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    (st.st_mtime_ns, st.st_size, config),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, entry)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception:
+        # Unwritable cache directories simply run without the disk cache
+        pass
+
+
+def _intern_keys(data: Any) -> Any:
+    """
+    Rebinds every string mapping key to its interned copy, in place. Parsed
+    configs repeat the same keys (source, target, configs, ...) thousands of
+    times; interned keys hash once and compare by identity on dict lookups.
+    """
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            items = list(node.items())
+            node.clear()
+            for k, v in items:
+                node[sys.intern(k) if type(k) is str else k] = v
+                if isinstance(v, (dict, list)):
+                    stack.append(v)
+        elif isinstance(node, list):
+            stack.extend(v for v in node if isinstance(v, (dict, list)))
+    return data
+
+
+def _store(key: str, mtime_ns: int, size: int, config: Any) -> None:
+    # Keys are interned once here; deepcopy hands out the same str objects.
+    _intern_keys(config)
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE[key] = (mtime_ns, size, config)
+        _YAML_CACHE.move_to_end(key)
+        if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
+
+
+def parallel_load_enabled() -> bool:
+    """
+    Threaded YAML loading is off unless DAGSTER_FACTORY_PARALLEL_LOAD is set to
+    1/true. Parsing holds the GIL, so threads only help when file reads are slow
+    (network filesystems).
+    """
+    return os.environ.get("DAGSTER_FACTORY_PARALLEL_LOAD", "0").lower() in ("1", "true", "yes")
+
+
+def load_yaml_files(
+    paths: Iterable[Union[str, Path]],
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> List[Tuple[Path, Any, Optional[Exception]]]:
+    """
+    Loads several YAML files through load_yaml_cached, overlapping file I/O on a
+    thread pool when parallel loading is enabled. Results keep the input order
+    as (path, config, error) so callers can report failures per file.
+    """
+
+    def _load(path: Path) -> Tuple[Path, Any, Optional[Exception]]:
+        try:
+            return path, load_yaml_cached(path, cache_dir), None
+        except Exception as e:
+            return path, None, e
+
+    paths = [Path(p) for p in paths]
+    if len(paths) < 2 or not parallel_load_enabled():
+        return [_load(p) for p in paths]
+
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(_load, paths))
+
+
+def _parse_with_stat(path: str) -> Tuple[str, int, int, Any]:
+    """Process-pool worker: stats and parses one file. Parse errors are left for the caller."""
+    st = os.stat(path)
+    try:
+        config = load_yaml(path)
+    except Exception:
+        return path, st.st_mtime_ns, st.st_size, None
+    return path, st.st_mtime_ns, st.st_size, config
+
+
+def preload_yaml_cache(
+    paths: Iterable[Union[str, Path]], max_workers: Optional[int] = None
+) -> None:
+    """
+    Parses YAML files in parallel worker processes and seeds the cache used by
+    load_yaml_cached. Files that fail to parse are skipped so the regular load
+    path reports the error with its usual context. Small batches and
+    single-CPU hosts are left to the regular sequential load, since starting
+    the pool would cost more than it saves.
+    """
+    paths = [str(p) for p in paths]
+    with _YAML_CACHE_LOCK:
+        pending = [p for p in paths if p not in _YAML_CACHE]
+    # Only as many files as the cache holds: the build reads files in discovery
+    # order, so later entries would evict earlier ones before they are used
+    pending = pending[:_YAML_CACHE_SIZE]
+
+    workers = max_workers or os.cpu_count() or 1
+    if len(pending) < PRELOAD_MIN_FILES or workers < 2:
+        return
+
+    # Batch files per task so IPC round-trips don't dominate for small configs
+    chunksize = max(1, len(pending) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for path, mtime, size, config in executor.map(
+            _parse_with_stat, pending, chunksize=chunksize
+        ):
+            if config is None:
+                continue
+            _store(path, mtime, size, config)
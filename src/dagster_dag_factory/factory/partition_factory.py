@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Hashable, Optional
 from dagster import (
     DailyPartitionsDefinition,
     HourlyPartitionsDefinition,
@@ -10,6 +10,7 @@ from dagster import (
     TimeWindowPartitionsDefinition,
     PartitionsDefinition,
 )
+from dagster_dag_factory.factory.helpers.dagster_helpers import freeze_config
 
 
 class PartitionFactory:
@@ -17,7 +18,7 @@ class PartitionFactory:
     Creates Dagster PartitionsDefinition objects from YAML configuration.
     """
 
-    _cache: Dict[str, PartitionsDefinition] = {}
+    _cache: Dict[Hashable, PartitionsDefinition] = {}
 
     @classmethod
     def get_partitions_def(
@@ -26,10 +27,8 @@ class PartitionFactory:
         if not config:
             return None
 
-        # Use a stable JSON string as the cache key
-        import json
-
-        cache_key = json.dumps(config, sort_keys=True)
+        # Order-independent, hashable copy of the config as the cache key
+        cache_key = freeze_config(config)
         if cache_key in cls._cache:
             return cls._cache[cache_key]
 
@@ -1,9 +1,17 @@
+import importlib
 from typing import Dict, Type, Tuple, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from dagster_dag_factory.operators.base_operator import BaseOperator
 
 
+def _builtin_modules() -> frozenset:
+    """Module paths of the built-in operators (see OPERATOR_MODULES)."""
+    from dagster_dag_factory.operators import OPERATOR_MODULES
+
+    return frozenset(OPERATOR_MODULES.values())
+
+
 class OperatorRegistry:
     """
     Central registry for operators.
@@ -12,6 +20,12 @@ class OperatorRegistry:
 
     _registry: Dict[Tuple[str, str], Type["BaseOperator"]] = {}
 
+    # Shared instances of stateless operators, keyed like _registry.
+    _instances: Dict[Tuple[str, str], "BaseOperator"] = {}
+
+    # Cached, pre-formatted listing used by the CLI; reset whenever an operator registers.
+    _formatted_rows: Optional[str] = None
+
     @classmethod
     def register(cls, source: str, target: str):
         """
@@ -23,7 +37,20 @@ class OperatorRegistry:
         """
 
         def wrapper(operator_class: Type["BaseOperator"]):
-            cls._registry[(source.upper(), target.upper())] = operator_class
+            key = (source.upper(), target.upper())
+            existing = cls._registry.get(key)
+            builtins = _builtin_modules()
+            if (
+                existing is not None
+                and operator_class.__module__ in builtins
+                and existing.__module__ not in builtins
+            ):
+                # Built-ins are imported lazily, possibly after a user operator
+                # claimed the same pair; the user's registration wins.
+                return operator_class
+            cls._registry[key] = operator_class
+            cls._instances.pop(key, None)
+            cls._formatted_rows = None
             return operator_class
 
         return wrapper
@@ -32,7 +59,59 @@ class OperatorRegistry:
     def get_operator(cls, source: Optional[str], target: Optional[str]) -> Optional[Type["BaseOperator"]]:
         """
         Retrieve a registered operator class.
+        Built-in operators are imported on first request (see OPERATOR_MODULES).
         """
         if source is None or target is None:
             return None
-        return cls._registry.get((source.upper(), target.upper()))
+        key = (source.upper(), target.upper())
+        operator_class = cls._registry.get(key)
+        if operator_class is None:
+            from dagster_dag_factory.operators import OPERATOR_MODULES
+
+            module_path = OPERATOR_MODULES.get(key)
+            if module_path:
+                importlib.import_module(module_path)
+                operator_class = cls._registry.get(key)
+        return operator_class
+
+    @classmethod
+    def load_all(cls) -> None:
+        """
+        Imports every built-in operator so the registry is complete (for listings).
+        """
+        from dagster_dag_factory.operators import OPERATOR_MODULES
+
+        for module_path in set(OPERATOR_MODULES.values()):
+            importlib.import_module(module_path)
+
+    @classmethod
+    def get_operator_instance(cls, source: Optional[str], target: Optional[str]) -> Optional["BaseOperator"]:
+        """
+        Retrieve an instance of a registered operator.
+        Stateless operators are instantiated once and shared; others are created per call.
+        """
+        operator_class = cls.get_operator(source, target)
+        if operator_class is None:
+            return None
+        # Only classes that declare stateless themselves are shared (see BaseOperator)
+        if not vars(operator_class).get("stateless", False):
+            return operator_class()
+
+        key = (source.upper(), target.upper())
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls._instances[key] = operator_class()
+        return instance
+
+    @classmethod
+    def formatted_rows(cls) -> str:
+        """
+        Returns the registered operators as one pre-joined, sorted table (built once).
+        """
+        cls.load_all()
+        if cls._formatted_rows is None:
+            cls._formatted_rows = "\n".join(
+                f"{source:<15} -> {target:<15} | {op_class.__name__}"
+                for (source, target), op_class in sorted(cls._registry.items())
+            )
+        return cls._formatted_rows
@@ -4,7 +4,7 @@ from dagster_dag_factory.sensors.base_sensor import SensorRegistry
 from dagster_dag_factory.factory.helpers.rendering import render_config
 import logging
 import pendulum
-import json
+import orjson
 from dagster_dag_factory.factory.helpers.dynamic import Dynamic
 
 logger = logging.getLogger("dagster_dag_factory")
@@ -122,10 +122,11 @@ class SensorFactory:
                         "factory/sensor": name,
                     }
 
-                    tags["factory/trigger"] = json.dumps(
-                        trigger_obj, 
-                        default=lambda x: x.isoformat() if hasattr(x, 'isoformat') else str(x)
-                    )
+                    tags["factory/trigger"] = orjson.dumps(
+                        trigger_obj,
+                        default=lambda x: x.isoformat() if hasattr(x, 'isoformat') else str(x),
+                        option=orjson.OPT_NON_STR_KEYS,
+                    ).decode()
                     
                     yield RunRequest(
                         run_key=run_key,
@@ -65,6 +65,12 @@ def log_marker(style: str = "normal", logger=None):
         _log.info(msg)
     return msg
 
+def info_enabled(logger=None) -> bool:
+    """True if an INFO record sent to logger (default: the build logger) would be emitted."""
+    target = logger if logger is not None else _log
+    is_enabled = getattr(target, "isEnabledFor", None)
+    return is_enabled is None or is_enabled(logging.INFO)
+
 def log_message(msg: str, level: int = logging.INFO):
     """Simple message logging."""
     _log.log(level, msg)
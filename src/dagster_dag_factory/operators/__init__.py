@@ -1,15 +1,28 @@
 """Configuration classes for operation-specific settings."""
 
+import importlib
 import pkgutil
 
 __path__ = pkgutil.extend_path(__path__, __name__)
 
-# Import operators here to ensure they register themselves
-from dagster_dag_factory.operators.sqlserver_s3 import SqlServerS3Operator
-from dagster_dag_factory.operators.sftp_s3 import SftpS3Operator
-from dagster_dag_factory.operators.s3_snowflake import S3SnowflakeOperator
-from dagster_dag_factory.operators.sqlserver_snowflake import SqlServerSnowflakeOperator
-from dagster_dag_factory.operators.s3_s3 import S3ToS3Operator
+# Operators register themselves on import. Rather than importing all of them
+# here, the registry imports a module the first time its (source, target) pair
+# is requested; this manifest tells it where each operator lives.
+OPERATOR_MODULES = {
+    ("SQLSERVER", "S3"): "dagster_dag_factory.operators.sqlserver_s3",
+    ("SFTP", "S3"): "dagster_dag_factory.operators.sftp_s3",
+    ("S3", "SNOWFLAKE"): "dagster_dag_factory.operators.s3_snowflake",
+    ("SQLSERVER", "SNOWFLAKE"): "dagster_dag_factory.operators.sqlserver_snowflake",
+    ("S3", "S3"): "dagster_dag_factory.operators.s3_s3",
+}
+
+_LAZY_EXPORTS = {
+    "SqlServerS3Operator": "dagster_dag_factory.operators.sqlserver_s3",
+    "SftpS3Operator": "dagster_dag_factory.operators.sftp_s3",
+    "S3SnowflakeOperator": "dagster_dag_factory.operators.s3_snowflake",
+    "SqlServerSnowflakeOperator": "dagster_dag_factory.operators.sqlserver_snowflake",
+    "S3ToS3Operator": "dagster_dag_factory.operators.s3_s3",
+}
 
 __all__ = [
     "SqlServerS3Operator",
@@ -18,3 +31,11 @@ __all__ = [
     "SqlServerSnowflakeOperator",
     "S3ToS3Operator",
 ]
+
+
+def __getattr__(name):
+    """Imports operator classes on first attribute access (PEP 562)."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_path), name)
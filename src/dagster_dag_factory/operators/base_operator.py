@@ -9,8 +9,21 @@ Provides a consistent interface for all operators following proven streaming pat
 
 Factory contract is maintained - no changes needed to factory code.
 """
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional
+
+from dagster import AssetCheckResult
+
+from dagster_dag_factory.factory.helpers.rendering import render_config
+from dagster_dag_factory.factory.utils.logging import (
+    convert_size,
+    convert_speed,
+    info_enabled,
+    log_action,
+    log_header,
+    log_marker,
+)
 
 
 class BaseOperator(ABC):
@@ -21,6 +34,11 @@ class BaseOperator(ABC):
     Subclasses only need to implement _execute() with their specific logic.
     """
 
+    # Operators that keep no state on self may set this to True so the registry
+    # shares one instance across assets. The flag is not inherited: each class
+    # opts in on its own, so subclasses that add state stay per-call.
+    stateless: ClassVar[bool] = False
+
     def _predicate(self, context: Any, predicate_template: Optional[str], info: Any, template_vars: Dict[str, Any]) -> bool:
         """
         Standardized Framework-style predicate evaluation.
@@ -39,7 +57,6 @@ class BaseOperator(ABC):
             runtime_vars.update(info.to_dict())
             
         # render_config handles full match objects (like booleans)
-        from dagster_dag_factory.factory.helpers.rendering import render_config
         result = render_config(predicate_template, runtime_vars)
         return str(result) == "True"
     
@@ -65,27 +82,25 @@ class BaseOperator(ABC):
             source_config: Source configuration model
             target_config: Target configuration model
             template_vars: Template variables for rendering
+            max_workers: Worker count for concurrent transfers, passed on to _execute()
             **kwargs: Additional resources (source_resource, target_resource, etc.)
         
         Returns:
             Dict containing execution results and statistics
         """
-        import time
-        from dagster_dag_factory.factory.utils.logging import log_header, log_marker
-        
-        self.max_workers = max_workers
-        
         # Determine asset name for logging
         asset_name = context.asset_key.to_user_string() if hasattr(context, "asset_key") else "unknown_asset"
 
-        # 1. Log Operator Header & Configs (Grouped)
-        log_block = []
-        log_block.append(log_header(f"OPERATOR | {self.__class__.__name__} ({asset_name})", logger=None))
-        log_block.append(self.log_operator_configs(context, source_config, target_config, logger=None))
-        log_block.append(log_marker("mini", logger=None))
-        
-        # Log as a single cohesive unit in Dagster UI
-        context.log.info("\n" + "\n".join(log_block))
+        # 1. Log Operator Header & Configs (Grouped). Masking and formatting the
+        # configs is skipped entirely when neither logger would emit INFO.
+        if info_enabled(context.log) or info_enabled():
+            log_block = []
+            log_block.append(log_header(f"OPERATOR | {self.__class__.__name__} ({asset_name})", logger=None))
+            log_block.append(self.log_operator_configs(context, source_config, target_config, logger=None))
+            log_block.append(log_marker("mini", logger=None))
+
+            # Log as a single cohesive unit in Dagster UI
+            context.log.info("\n" + "\n".join(log_block))
 
         start_time = time.time()
         
@@ -93,7 +108,9 @@ class BaseOperator(ABC):
         self.pre_execute(context, source_config, target_config, **kwargs)
         
         # 3. Main execution (operator-specific)
-        result = self._execute(context, source_config, target_config, template_vars, **kwargs)
+        result = self._execute(
+            context, source_config, target_config, template_vars, max_workers=max_workers, **kwargs
+        )
         
         # 4. Post-execution
         duration = time.time() - start_time
@@ -139,6 +156,7 @@ class BaseOperator(ABC):
         Operator-specific execution logic.
         
         Subclasses MUST implement this method with their transfer logic.
+        kwargs also carries max_workers, the worker count configured for the asset.
         Use execute_streaming() utility for threaded operations.
         
         Args:
@@ -162,8 +180,6 @@ class BaseOperator(ABC):
         """
         Post-execution hook for cleanup and stats.
         """
-        from dagster_dag_factory.factory.utils.logging import log_action, convert_size, convert_speed
-        
         # Extract stats from result
         stats = result.get("stats", {}) if result else {}
         
@@ -191,8 +207,6 @@ class BaseOperator(ABC):
         """
         Log configurations for troubleshooting.
         """
-        from dagster_dag_factory.factory.utils.logging import log_action
-        
         def _get_masked_summary(config):
             if hasattr(config, "to_masked_dict"):
                 data = config.to_masked_dict()
@@ -218,8 +232,6 @@ class BaseOperator(ABC):
         This method is called by the factory for asset checks.
         Default implementation supports observation_diff checks.
         """
-        from dagster import AssetCheckResult
-        
         check_type = config.get("type", "observation_diff")
         
         if check_type == "observation_diff":
@@ -240,8 +252,6 @@ class BaseOperator(ABC):
         """
         Execute an observation diff check comparing source and target counts.
         """
-        from dagster import AssetCheckResult
-        
         asset_key = config.get("_asset_key")
         source_key = config["source_key"]
         target_key = config["target_key"]
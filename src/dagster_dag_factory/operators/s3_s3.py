@@ -25,6 +25,7 @@ class S3ToS3Operator(BaseOperator):
     """
     source_config_schema = S3Config
     target_config_schema = S3Config
+    stateless = True
 
     def _execute(
         self,
@@ -41,7 +42,7 @@ class S3ToS3Operator(BaseOperator):
         bucket = source_config.bucket_name
         prefix = source_config.key or source_config.prefix or ""
         pattern = source_config.pattern
-        num_workers = self.max_workers
+        num_workers = kwargs.get("max_workers", 5)
 
         # Render runtime config for each file
         def render_runtime_config(item_info):
@@ -19,6 +19,7 @@ class S3SnowflakeOperator(BaseOperator):
 
     source_config_schema = S3Config
     target_config_schema = SnowflakeConfig
+    stateless = True
 
     def _execute(
         self,
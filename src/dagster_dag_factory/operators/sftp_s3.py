@@ -26,6 +26,7 @@ class SftpS3Operator(BaseOperator):
     """
     source_config_schema = SFTPConfig
     target_config_schema = S3Config
+    stateless = True
     
     def _execute(
         self,
@@ -53,7 +54,7 @@ class SftpS3Operator(BaseOperator):
             pattern = source_config.pattern
             
         s3_prefix = target_config.prefix or ""
-        num_workers = self.max_workers
+        num_workers = kwargs.get("max_workers", 5)
         
         # Prepare predicate callback for Framework-style evaluation
         predicate_fn = None
@@ -25,6 +25,7 @@ class SqlServerS3Operator(BaseOperator):
     """
     source_config_schema = SQLServerConfig
     target_config_schema = S3Config
+    stateless = True
     
     def _execute(
         self,
@@ -17,6 +17,7 @@ class SqlServerSnowflakeOperator(BaseOperator):
 
     source_config_schema = SQLServerConfig
     target_config_schema = SnowflakeConfig
+    stateless = True
 
     def _execute(
         self,
@@ -1,6 +1,7 @@
 from typing import List, Any, ClassVar
 from dagster import ConfigurableResource
 import json
+from dagster_dag_factory.configs.base import mask_pattern
 
 
 class BaseConfigurableResource(ConfigurableResource):
@@ -30,9 +31,10 @@ class BaseConfigurableResource(ConfigurableResource):
 
     def _recursive_mask(self, data: Any) -> Any:
         if isinstance(data, dict):
+            search = mask_pattern(self.mask_fields).search
             new_data = {}
             for k, v in data.items():
-                if any(m in k.lower() for m in self.mask_fields):
+                if search(k.lower()) is not None:
                     new_data[k] = "******" if v else v
                 else:
                     new_data[k] = self._recursive_mask(v)
@@ -4,20 +4,37 @@ from pydantic import Field
 import paramiko
 import re
 import os
+import socket
 import stat
 import io
 import base64
 
-# pysftp 0.2.9 is incompatible with modern paramiko because it tries to import DSSKey.
-# We monkeypatch it here to allow pysftp to load.
-if not hasattr(paramiko, "DSSKey"):
-    paramiko.DSSKey = paramiko.PKey  # Dummy type to satisfy import
-
-import pysftp
 from dagster_dag_factory.models.file_info import FileInfo
 from dagster_dag_factory.resources.base import BaseConfigurableResource
 from dagster_dag_factory.utils.base64 import from_b64_str
 
+# Socket buffers are sized before connect so TCP window scaling can use them.
+SOCKET_BUFFER_SIZE = 32 * 1024 * 1024
+
+
+def _open_tuned_socket(host: str, port: int) -> socket.socket:
+    """Opens a TCP connection with Nagle disabled and large send/receive buffers."""
+    error = None
+    for family, socktype, proto, _, address in socket.getaddrinfo(
+        host, port, 0, socket.SOCK_STREAM
+    ):
+        sock = socket.socket(family, socktype, proto)
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            sock.connect(address)
+            return sock
+        except OSError as e:
+            sock.close()
+            error = e
+    raise error or OSError(f"Unable to connect to {host}:{port}")
+
 
 class SFTPResource(BaseConfigurableResource):
     """
@@ -41,8 +58,10 @@ class SFTPResource(BaseConfigurableResource):
 
     @contextmanager
     def get_client(self):
-        cnopts = pysftp.CnOpts()
-
+        """
+        Yields a paramiko SFTPClient. The SSH transport is built on a socket
+        from _open_tuned_socket, through paramiko's public Transport(sock).
+        """
         # Mapping of key types to paramiko classes
         key_map: Dict[str, Type[paramiko.PKey]] = {
             "RSA": paramiko.RSAKey,
@@ -58,6 +77,11 @@ class SFTPResource(BaseConfigurableResource):
         resolved_public_key = self.resolve("public_key")
         resolved_private_key = self.resolve("private_key")
 
+        known_hosts = os.path.expanduser("~/.ssh/known_hosts")
+        host_keys: Optional[paramiko.HostKeys] = paramiko.HostKeys()
+        if os.path.exists(known_hosts):
+            host_keys.load(known_hosts)
+
         if resolved_public_key:
             # Handle full SSH string like "ssh-rsa AAAAB3..." or just the data
             parts = resolved_public_key.strip().split()
@@ -65,7 +89,7 @@ class SFTPResource(BaseConfigurableResource):
                 algo = parts[0]
                 key_data_b64 = parts[1]
                 public_key = pkey_class(data=base64.b64decode(key_data_b64))
-                cnopts.hostkeys.add(resolved_host, algo, public_key)
+                host_keys.add(resolved_host, algo, public_key)
             else:
                 # Assume it's just the B64 data part
                 public_key = pkey_class(data=base64.b64decode(resolved_public_key))
@@ -76,36 +100,57 @@ class SFTPResource(BaseConfigurableResource):
                     "ED25519": "ssh-ed25519",
                 }
                 algo = algo_map.get(self.key_type.upper(), "ssh-rsa")
-                cnopts.hostkeys.add(resolved_host, algo, public_key)
-        else:
-            if not os.path.exists(os.path.expanduser("~/.ssh/known_hosts")):
-                cnopts.hostkeys = None
-
-        connection_args = {
-            "host": resolved_host,
-            "username": resolved_username,
-            "port": self.port,
-            "cnopts": cnopts,
-        }
-
+                host_keys.add(resolved_host, algo, public_key)
+        elif not os.path.exists(known_hosts):
+            # No known_hosts and no configured key: host key checking is off
+            host_keys = None
+
+        hostkey = None
+        if host_keys is not None:
+            known = host_keys.lookup(resolved_host)
+            if known is None:
+                raise paramiko.SSHException(f"No hostkey for host {resolved_host} found.")
+            hostkey = next(iter(known.values()))
+
+        pkey = None
+        password = None
         if resolved_private_key:
             # User provides private key as b64 encoded
             private_key_str = from_b64_str(resolved_private_key)
-            private_key = pkey_class.from_private_key(io.StringIO(private_key_str))
-            connection_args["private_key"] = private_key
+            pkey = pkey_class.from_private_key(io.StringIO(private_key_str))
+        elif resolved_password is not None:
+            password = resolved_password
+        elif os.path.exists(os.path.expanduser("~/.ssh/id_rsa")):
+            # Fall back to the user's default key
+            pkey = paramiko.RSAKey.from_private_key_file(os.path.expanduser("~/.ssh/id_rsa"))
         else:
-            connection_args["password"] = resolved_password
+            raise paramiko.AuthenticationException("No password or key specified.")
 
-        connection = pysftp.Connection(**connection_args)
+        sock = _open_tuned_socket(resolved_host, self.port)
+        try:
+            transport = paramiko.Transport(sock)
+        except BaseException:
+            # The transport never took ownership of the socket
+            sock.close()
+            raise
+        try:
+            transport.connect(
+                hostkey=hostkey, username=resolved_username, password=password, pkey=pkey
+            )
+            client = paramiko.SFTPClient.from_transport(transport)
+        except BaseException:
+            transport.close()
+            raise
 
         try:
-            yield connection
+            yield client
         finally:
-            connection.close()
+            client.close()
+            transport.close()
 
     def list_files(
         self,
-        conn: pysftp.Connection,
+        conn: paramiko.SFTPClient,
         path: str,
         pattern: str = None,
         recursive: bool = False,
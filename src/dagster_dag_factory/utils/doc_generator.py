@@ -40,6 +40,7 @@ def generate_docs(output_path: str):
     lines.append("## Operators\n")
     lines.append("Operators define how data moves between a source and a target.\n")
 
+    OperatorRegistry.load_all()
     for (source, target), op_class in OperatorRegistry._registry.items():
         lines.append(f"### `{source}` to `{target}` (`{op_class.__name__}`)")
         if op_class.__doc__:
@@ -2,9 +2,6 @@ import sys
 from dagster import AssetSelection
 from dagster._core.definitions.unresolved_asset_job_definition import UnresolvedAssetJobDefinition
 
-# Add src to path
-sys.path.append("/home/ukatru/github/dagster-dag-factory/src")
-
 from dagster_dag_factory.factory.job_factory import JobFactory
 
 def verify():
@@ -4,9 +4,6 @@ import yaml
 from pathlib import Path
 from dagster import AssetsDefinition, RetryPolicy
 
-# Add src to path
-sys.path.append("/home/ukatru/github/dagster-dag-factory/src")
-
 from dagster_dag_factory.factory.asset_factory import AssetFactory
 
 def verify():
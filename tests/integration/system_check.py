@@ -1,5 +1,4 @@
 import os
-import sys
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -8,14 +7,13 @@ from dagster import get_dagster_logger
 def load_dotenv_manual(dotenv_path):
     if not os.path.exists(dotenv_path):
         return
-    with open(dotenv_path) as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" in line:
-                key, value = line.split("=", 1)
-                os.environ[key.strip()] = value.strip().strip('"').strip("'")
+    env = {}
+    for line in Path(dotenv_path).read_text().splitlines():
+        key, sep, value = line.strip().partition("=")
+        if not sep or key.startswith("#"):
+            continue
+        env[key.strip()] = value.strip().strip("\"'")
+    os.environ.update(env)
 
 def check_system():
     # 1. Setup paths dynamically
@@ -24,9 +22,6 @@ def check_system():
     root_dir = current_file.parents[2] # github/dagster-dag-factory
     pip_dir = root_dir.parent / "dagster-pipelines"
     
-    # Add src to python path
-    sys.path.append(str(root_dir / "src"))
-    
     # Load environment variables
     load_dotenv_manual(pip_dir / ".env")
     
@@ -1,5 +1,4 @@
 import os
-import sys
 import time
 import logging
 from pathlib import Path
@@ -8,15 +7,15 @@ from pathlib import Path
 current_file = Path(__file__).resolve()
 root_dir = current_file.parents[2]
 pip_dir = root_dir.parent / "dagster-pipelines"
-sys.path.append(str(root_dir / "src"))
 
 def load_dotenv_manual(path):
     if not os.path.exists(path): return
-    with open(path) as f:
-        for line in f:
-            if "=" in line:
-                k, v = line.strip().split("=", 1)
-                os.environ[k.strip()] = v.strip().strip("\"").strip("'")
+    env = {}
+    for line in Path(path).read_text().splitlines():
+        k, sep, v = line.strip().partition("=")
+        if sep and not k.startswith("#"):
+            env[k.strip()] = v.strip().strip("\"'")
+    os.environ.update(env)
 
 load_dotenv_manual(pip_dir / ".env")
 
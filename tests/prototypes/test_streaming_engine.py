@@ -1,10 +1,5 @@
 import time
 import random
-import sys
-import os
-
-# Add src to path
-sys.path.append(os.path.join(os.getcwd(), "src"))
 
 from dagster_dag_factory.factory.helpers.streaming import execute_parallel_stream
 
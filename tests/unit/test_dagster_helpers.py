@@ -0,0 +1,61 @@
+import unittest
+from dagster_dag_factory.factory.helpers.dagster_helpers import (
+    freeze_config,
+    memoize_config,
+)
+
+class TestFreezeConfig(unittest.TestCase):
+    def test_dict_order_does_not_matter(self):
+        self.assertEqual(
+            freeze_config({"a": 1, "b": [1, 2]}),
+            freeze_config({"b": [1, 2], "a": 1}),
+        )
+
+    def test_equal_but_differently_typed_leaves_stay_distinct(self):
+        keys = {freeze_config(1), freeze_config(1.0), freeze_config(True)}
+        self.assertEqual(len(keys), 3)
+
+    def test_list_order_matters(self):
+        self.assertNotEqual(freeze_config([1, 2]), freeze_config([2, 1]))
+
+class TestMemoizeConfig(unittest.TestCase):
+    def test_equal_configs_share_one_result(self):
+        calls = []
+
+        @memoize_config
+        def build(config):
+            calls.append(config)
+            return object()
+
+        first = build({"cron": "0 * * * *", "tags": ["a"]})
+        second = build({"tags": ["a"], "cron": "0 * * * *"})
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 1)
+
+    def test_unhashable_values_are_built_uncached(self):
+        calls = []
+
+        @memoize_config
+        def build(config):
+            calls.append(config)
+            return len(calls)
+
+        self.assertEqual(build({"tags": {"a"}}), 1)
+        self.assertEqual(build({"tags": {"a"}}), 2)
+
+    def test_errors_are_not_cached(self):
+        attempts = []
+
+        @memoize_config
+        def build(config):
+            attempts.append(config)
+            if len(attempts) == 1:
+                raise ValueError("boom")
+            return "ok"
+
+        with self.assertRaises(ValueError):
+            build({"a": 1})
+        self.assertEqual(build({"a": 1}), "ok")
+
+if __name__ == "__main__":
+    unittest.main()
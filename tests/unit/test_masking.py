@@ -1,5 +1,7 @@
 from dagster_dag_factory.configs.s3 import S3Config
 from dagster_dag_factory.configs.sqlserver import SQLServerConfig
+from dagster_dag_factory.configs.base import BaseConfigModel
+from typing import ClassVar, List
 import json
 
 def test_masking():
@@ -39,5 +41,23 @@ def test_masking():
     else:
         print("FAILURE: Secret token is NOT masked.")
 
+def test_nested_model_keeps_parent_mask_fields():
+    class ApiConfig(BaseConfigModel):
+        mask_fields: ClassVar[List[str]] = ["apikey"]
+        apikey: str = ""
+        password: str = ""
+        url: str = ""
+
+    class JobConfig(BaseConfigModel):
+        api: ApiConfig
+
+    conf = JobConfig(api=ApiConfig(apikey="k", password="p", url="https://example.com"))
+    masked = conf.to_masked_dict()
+
+    # The child's own token and the parent's default tokens both apply
+    assert masked["api"] == {"apikey": "******", "password": "******", "url": "https://example.com"}
+    # On its own, the child only masks its own tokens
+    assert conf.api.to_masked_dict()["password"] == "p"
+
 if __name__ == "__main__":
     test_masking()
@@ -3,7 +3,7 @@ import unittest
 from pathlib import Path
 from dagster import EnvVar
 from dagster_dag_factory.factory.asset_factory import AssetFactory
-from dagster_dag_factory.factory.helpers.rendering import render_config
+from dagster_dag_factory.factory.helpers.rendering import CompiledConfig, render_config
 from dagster_dag_factory.factory.helpers.env_accessor import EnvVarAccessor
 from dagster_dag_factory.factory.helpers.dynamic import Dynamic
 
@@ -141,5 +141,55 @@ class TestVariableRendering(unittest.TestCase):
         rendered_nested = render_config(config_nested, template_vars)
         self.assertEqual(rendered_nested, "File: test.csv")
 
+class TestCompiledConfig(unittest.TestCase):
+    def setUp(self):
+        self.template_vars = {
+            "vars": Dynamic({"bucket": "raw", "env": "dev"}),
+            "source": Dynamic({"item": {"name": "orders"}}),
+        }
+
+    def assertRendersLikeRenderConfig(self, config):
+        expected = render_config(config, self.template_vars)
+        compiled = CompiledConfig(config)
+        self.assertEqual(compiled.render(self.template_vars), expected)
+        # Rendering again gives the same result from the same compiled tree
+        self.assertEqual(compiled.render(self.template_vars), expected)
+
+    def test_matches_render_config(self):
+        self.assertRendersLikeRenderConfig({
+            "key": "{{vars.bucket}}/{{source.item.name}}.csv",
+            "static": {"nested": ["a", 1, None, True]},
+            "columns": ["{{vars.env}}", "id"],
+            "comment": "{# dropped #}kept",
+            "missing": "{{vars.unknown}}",
+        })
+
+    def test_matches_render_config_for_newlines(self):
+        # Jinja normalizes \r and \r\n and strips a single trailing newline;
+        # both render paths must keep that behaviour for untemplated strings too
+        config = {
+            "crlf": "line1\r\nline2",
+            "cr": "a\rb",
+            "trailing": "select 1\n",
+            "templated_trailing": "{{vars.env}}\n",
+            "plain": "no template here",
+        }
+        self.assertRendersLikeRenderConfig(config)
+        self.assertEqual(render_config(config, self.template_vars), {
+            "crlf": "line1\nline2",
+            "cr": "a\nb",
+            "trailing": "select 1",
+            "templated_trailing": "dev",
+            "plain": "no template here",
+        })
+
+    def test_static_payload_returns_fresh_copies(self):
+        config = {"static": {"values": [1, 2]}}
+        compiled = CompiledConfig(config)
+        rendered = compiled.render(self.template_vars)
+        rendered["static"]["values"].append(3)
+        self.assertEqual(compiled.render(self.template_vars), {"static": {"values": [1, 2]}})
+        self.assertEqual(config, {"static": {"values": [1, 2]}})
+
 if __name__ == "__main__":
     unittest.main()
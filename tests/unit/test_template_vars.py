@@ -0,0 +1,29 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from dagster import AssetCheckExecutionContext
+from dagster_dag_factory.factory import asset_factory
+from dagster_dag_factory.factory.asset_factory import AssetFactory
+
+class TestTemplateVars(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.factory = AssetFactory(Path(self.tmp_dir.name))
+        self.context = MagicMock(spec=AssetCheckExecutionContext)
+        self.context.op_execution_context.has_partition_key = False
+        self.context.run.tags = {}
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_macros_resolved_once(self):
+        with patch.object(asset_factory, "get_macros", wraps=asset_factory.get_macros) as spy:
+            template_vars = self.factory._get_template_vars(self.context)
+
+        spy.assert_called_once_with(self.context)
+        self.assertIn("fn", template_vars)
+        self.assertIsNone(template_vars["partition_key"])
+
+if __name__ == "__main__":
+    unittest.main()
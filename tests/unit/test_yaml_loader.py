@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from dagster_dag_factory.factory.helpers import yaml_loader
+from dagster_dag_factory.factory.helpers.yaml_loader import (
+    PRELOAD_MIN_FILES,
+    disk_cache_dir,
+    iter_yaml_files,
+    load_yaml_cached,
+    preload_yaml_cache,
+)
+
+class TestYamlCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        yaml_loader._YAML_CACHE.clear()
+
+    def tearDown(self):
+        yaml_loader._YAML_CACHE.clear()
+        self.tmp.cleanup()
+
+    def _write(self, path: Path, text: str, mtime_ns: int):
+        path.write_text(text)
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_reparses_when_mtime_changes(self):
+        path = self.root / "pipeline.yaml"
+        self._write(path, "name: a\n", 1_000_000_000)
+        self.assertEqual(load_yaml_cached(path), {"name": "a"})
+
+        # Same size, new mtime: the cached parse must not be reused
+        self._write(path, "name: b\n", 2_000_000_000)
+        self.assertEqual(load_yaml_cached(path), {"name": "b"})
+
+    def test_returns_independent_copies(self):
+        path = self.root / "pipeline.yaml"
+        self._write(path, "assets:\n  - name: a\n", 1_000_000_000)
+        first = load_yaml_cached(path)
+        first["assets"].append({"name": "b"})
+        self.assertEqual(load_yaml_cached(path), {"assets": [{"name": "a"}]})
+
+    def test_disk_cache_is_opt_in(self):
+        with mock.patch.dict(os.environ, clear=False) as env:
+            env.pop("DAGSTER_FACTORY_DISK_CACHE_DIR", None)
+            self.assertIsNone(disk_cache_dir())
+            env["DAGSTER_FACTORY_DISK_CACHE_DIR"] = str(self.root / "cache")
+            self.assertEqual(disk_cache_dir(), self.root / "cache")
+
+    def test_disk_cache_invalidates_on_mtime_change(self):
+        cache_dir = self.root / "cache"
+        path = self.root / "pipeline.yaml"
+        self._write(path, "name: a\n", 1_000_000_000)
+        self.assertEqual(load_yaml_cached(path, cache_dir), {"name": "a"})
+        self.assertEqual(len(list(cache_dir.glob("*.pkl"))), 1)
+
+        # A fresh process only has the disk entry to go on
+        yaml_loader._YAML_CACHE.clear()
+        self._write(path, "name: b\n", 2_000_000_000)
+        self.assertEqual(load_yaml_cached(path, cache_dir), {"name": "b"})
+        # The entry for the file is replaced, not accumulated
+        self.assertEqual(len(list(cache_dir.glob("*.pkl"))), 1)
+
+        yaml_loader._YAML_CACHE.clear()
+        self.assertEqual(load_yaml_cached(path, cache_dir), {"name": "b"})
+
+    def test_preload_leaves_small_batches_to_the_regular_load(self):
+        paths = []
+        for i in range(PRELOAD_MIN_FILES - 1):
+            path = self.root / f"p{i}.yaml"
+            self._write(path, f"name: p{i}\n", 1_000_000_000)
+            paths.append(path)
+        with mock.patch.object(yaml_loader, "ProcessPoolExecutor") as pool:
+            preload_yaml_cache(paths, max_workers=4)
+        pool.assert_not_called()
+        self.assertEqual(len(yaml_loader._YAML_CACHE), 0)
+
+class TestYamlDiscovery(unittest.TestCase):
+    def test_finds_yaml_and_yml_and_prunes_hidden_dirs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for rel in (
+                "a.yaml",
+                "sub/b.yml",
+                "sub/deeper/c.yaml",
+                "notes.txt",
+                ".git/config.yaml",
+                "sub/.cache/d.yaml",
+                "__pycache__/e.yaml",
+            ):
+                path = root / rel
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text("name: x\n")
+
+            found = sorted(p.relative_to(root).as_posix() for p in iter_yaml_files(root))
+            self.assertEqual(found, ["a.yaml", "sub/b.yml", "sub/deeper/c.yaml"])
+
+    def test_missing_root_yields_nothing(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertEqual(list(iter_yaml_files(Path(tmp) / "missing")), [])
+
+if __name__ == "__main__":
+    unittest.main()